@@ -74,7 +74,13 @@ class ReportGenerator:
           else:
             change_text = " (No change)"
         
-        lines.append(f"    - {month}: {current_subscribers:,}{change_text}")
+        # Intra-month range, only when the month has more than one snapshot
+        range_text = ""
+        rollup = webtoon_data.get_monthly_rollup(month)
+        if rollup and rollup["count"] > 1:
+          range_text = f" [Min: {rollup['min']:,}, Max: {rollup['max']:,}, Mean: {round(rollup['mean']):,}]"
+        
+        lines.append(f"    - {month}: {current_subscribers:,}{change_text}{range_text}")
         previous_subscribers = current_subscribers
     
     return lines
@@ -36,9 +36,7 @@ class WebtoonManager:
     def fetch_and_update(url: str) -> None:
       webtoon_info = self.scraper.scrape_webtoon_info(url)
       if webtoon_info:
-        webtoon = self.database.get_webtoon(url)
-        if webtoon:
-          webtoon.add_current_month_data(webtoon_info.subscribers)
+        self.database.record_snapshot(url, webtoon_info.subscribers)
     
     with ThreadPoolExecutor(max_workers=5) as executor:
       list(executor.map(fetch_and_update, urls))
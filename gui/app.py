@@ -174,8 +174,10 @@ class App(ctk.CTk):
     if webtoon_data and webtoon_data.monthly_data:
       months = sorted(webtoon_data.monthly_data.keys())
       subscribers = [webtoon_data.monthly_data[month] for month in months]
+      rollups = [webtoon_data.get_monthly_rollup(month) for month in months]
       
       plt.figure(figsize=(10, 6))
+      plt.fill_between(months, [r["min"] for r in rollups], [r["max"] for r in rollups], color="b", alpha=0.2)
       plt.plot(months, subscribers, marker="o", linestyle="-", color="b")
       plt.title(f"Subscriber Activity for {webtoon_data.title}")
       plt.xlabel("Month")
@@ -3,36 +3,67 @@
 import os
 import json
 import tkinter.messagebox as tkmb
-from storage.models import WebtoonDatabase
+from typing import Dict
+from storage.models import WebtoonDatabase, SNAPSHOT_GRANULARITY, HOURLY_RETENTION_DAYS, DAILY_RETENTION_DAYS
 
 # Constants
 DATA_FOLDER = "./data"
 DATA_FILE = "data.json"
 DATA_PATH = os.path.join(DATA_FOLDER, DATA_FILE)
+SETTINGS_FILE = "settings.json"
+SETTINGS_PATH = os.path.join(DATA_FOLDER, SETTINGS_FILE)
+DEFAULT_SETTINGS = {
+  "granularity": SNAPSHOT_GRANULARITY,
+  "hourly_retention_days": HOURLY_RETENTION_DAYS,
+  "daily_retention_days": DAILY_RETENTION_DAYS
+}
 
 class DataManager:
   """Handles loading and saving webtoon data to/from JSON files."""
   
+  @staticmethod
+  def load_settings() -> Dict:
+    """Load snapshot settings from JSON file, falling back to the defaults."""
+    settings = DEFAULT_SETTINGS.copy()
+    try:
+      with open(SETTINGS_PATH, "r") as f:
+        settings.update(json.load(f))
+      
+      # Validate by building a database with the settings
+      WebtoonDatabase(**settings)
+      return settings
+        
+    except FileNotFoundError:
+      # File doesn't exist - use defaults
+      return DEFAULT_SETTINGS.copy()
+    except json.JSONDecodeError:
+      tkmb.showerror("Error", "Settings file is corrupted. Using default settings.")
+      return DEFAULT_SETTINGS.copy()
+    except Exception as e:
+      tkmb.showerror("Error", f"Invalid settings, using defaults: {str(e)}")
+      return DEFAULT_SETTINGS.copy()
+  
   @staticmethod
   def load_database() -> WebtoonDatabase:
     """Load webtoon database from JSON file."""
+    settings = DataManager.load_settings()
     try:
       with open(DATA_PATH, "r") as f:
         raw_data = json.load(f)
       
-      database = WebtoonDatabase()
+      database = WebtoonDatabase(**settings)
       database.load_from_dict(raw_data)
       return database
         
     except FileNotFoundError:
       # File doesn't exist yet - return empty database
-      return WebtoonDatabase()
+      return WebtoonDatabase(**settings)
     except json.JSONDecodeError:
       tkmb.showerror("Error", "Data file is corrupted. Edit the file or delete it.")
-      return WebtoonDatabase()
+      return WebtoonDatabase(**settings)
     except Exception as e:
       tkmb.showerror("Error", f"Failed to load data: {str(e)}")
-      return WebtoonDatabase()
+      return WebtoonDatabase(**settings)
   
   @staticmethod
   def save_database(database: WebtoonDatabase) -> bool:
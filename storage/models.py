@@ -1,8 +1,26 @@
 """Simple data models for the Webtoon Subscriber Tracker."""
 
-from dataclasses import dataclass
-from typing import Dict, Optional
-from utils.formatters import get_current_month_key
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, TypedDict
+from utils.formatters import SNAPSHOT_KEY_FORMATS, get_snapshot_key, get_month_from_snapshot_key
+
+# Default snapshot settings (overridden by data/settings.json)
+SNAPSHOT_GRANULARITY = "monthly"  # "monthly", "daily" or "hourly"
+HOURLY_RETENTION_DAYS = 7  # Older hourly snapshots are downsampled to daily
+DAILY_RETENTION_DAYS = 90  # Older snapshots are dropped (monthly rollups are kept)
+
+class MonthlyRollup(TypedDict):
+  """Summary of a month's snapshots."""
+  last: int
+  min: int
+  max: int
+  mean: float
+  count: int
+
+def _single_value_rollup(subscribers: int) -> MonthlyRollup:
+  """Build the rollup for a month with a single snapshot."""
+  return {"last": subscribers, "min": subscribers, "max": subscribers, "mean": subscribers, "count": 1}
 
 @dataclass
 class WebtoonInfo:
@@ -16,7 +34,9 @@ class WebtoonData:
   """Complete data for a tracked webtoon."""
   title: str
   url: str
-  monthly_data: Dict[str, int]  # "2024-09" -> 123456
+  monthly_data: Dict[str, int]  # "2024-09" -> 123456 (latest count of the month)
+  snapshots: Dict[str, int] = field(default_factory=dict)  # "2024-09-15" or "2024-09-15T13" -> 123456
+  monthly_rollups: Dict[str, MonthlyRollup] = field(default_factory=dict)  # "2024-09" -> {"last", "min", "max", "mean", "count"}
   
   def get_latest_subscribers(self) -> Optional[int]:
     """Get most recent subscriber count, or None if no data."""
@@ -25,16 +45,88 @@ class WebtoonData:
     latest_month = sorted(self.monthly_data.keys())[-1]
     return self.monthly_data[latest_month]
   
-  def add_current_month_data(self, subscribers: int) -> None:
-    """Add subscriber data for the current month."""
-    current_month = get_current_month_key()
-    self.monthly_data[current_month] = subscribers
+  def add_snapshot(self, subscribers: int, granularity: str, now: Optional[datetime] = None) -> None:
+    """Record a subscriber count and update the monthly rollup for its month.
+    
+    Recording again within the same snapshot period replaces that period's value.
+    """
+    snapshot_key = get_snapshot_key(granularity, now)
+    month = get_month_from_snapshot_key(snapshot_key)
+    
+    # Monthly granularity keeps one value per month, which monthly_data already holds
+    if granularity == "monthly":
+      self.monthly_rollups.pop(month, None)
+      self.snapshots = {key: value for key, value in self.snapshots.items() if get_month_from_snapshot_key(key) != month}
+      self.monthly_data[month] = subscribers
+      return
+    
+    previous = self.snapshots.get(snapshot_key)
+    self.snapshots[snapshot_key] = subscribers
+    
+    # Update the rollup incrementally so readers never scan raw snapshots
+    rollup = self.get_monthly_rollup(month)
+    if rollup is None:
+      rollup = _single_value_rollup(subscribers)
+    elif previous is None:
+      rollup = dict(rollup)  # Copy, since legacy months return a fresh fallback rollup
+      rollup["count"] += 1
+      rollup["min"] = min(rollup["min"], subscribers)
+      rollup["max"] = max(rollup["max"], subscribers)
+      rollup["mean"] += (subscribers - rollup["mean"]) / rollup["count"]
+    else:
+      rollup = dict(rollup)
+      rollup["mean"] += (subscribers - previous) / rollup["count"]
+      month_values = [value for key, value in self.snapshots.items() if get_month_from_snapshot_key(key) == month]
+      if len(month_values) == rollup["count"]:
+        rollup["min"] = min(month_values)
+        rollup["max"] = max(month_values)
+      else:
+        # Some of the month's snapshots are no longer retained, so min/max stay bounds over every value seen
+        rollup["min"] = min(rollup["min"], subscribers)
+        rollup["max"] = max(rollup["max"], subscribers)
+    rollup["last"] = subscribers
+    
+    self.monthly_rollups[month] = rollup
+    self.monthly_data[month] = subscribers
+  
+  def get_monthly_rollup(self, month: str) -> Optional[MonthlyRollup]:
+    """Get the last/min/max/mean rollup for a month, or None if no data."""
+    rollup = self.monthly_rollups.get(month)
+    if rollup is None and month in self.monthly_data:
+      # Months recorded before rollups existed only have a single value
+      rollup = _single_value_rollup(self.monthly_data[month])
+    return rollup
+  
+  def apply_retention(self, hourly_retention_days: int, daily_retention_days: int, now: Optional[datetime] = None) -> None:
+    """Downsample old hourly snapshots to daily and drop snapshots past retention."""
+    now = now or datetime.now()
+    hourly_cutoff = (now - timedelta(days=hourly_retention_days)).strftime("%Y-%m-%d")
+    daily_cutoff = (now - timedelta(days=daily_retention_days)).strftime("%Y-%m-%d")
+    
+    retained = {}
+    for snapshot_key in sorted(self.snapshots.keys()):
+      day = snapshot_key[:10]
+      if day < daily_cutoff:
+        continue  # Still covered by the monthly rollup
+      if len(snapshot_key) > len(day) and day < hourly_cutoff:
+        retained[day] = self.snapshots[snapshot_key]  # Sorted, so the last hour of the day wins
+      else:
+        retained[snapshot_key] = self.snapshots[snapshot_key]
+    self.snapshots = retained
 
 class WebtoonDatabase:
     """Manages all webtoon data."""
     
-    def __init__(self):
+    def __init__(self, granularity: str = SNAPSHOT_GRANULARITY, hourly_retention_days: int = HOURLY_RETENTION_DAYS, daily_retention_days: int = DAILY_RETENTION_DAYS):
+      if granularity not in SNAPSHOT_KEY_FORMATS:
+        raise ValueError(f"Unknown snapshot granularity: {granularity}")
+      for name, days in [("hourly_retention_days", hourly_retention_days), ("daily_retention_days", daily_retention_days)]:
+        if not isinstance(days, int) or isinstance(days, bool) or days < 0:
+          raise ValueError(f"{name} must be a non-negative whole number: {days!r}")
       self._webtoons: Dict[str, WebtoonData] = {}
+      self.granularity = granularity
+      self.hourly_retention_days = hourly_retention_days
+      self.daily_retention_days = daily_retention_days
     
     def load_from_dict(self, data: Dict) -> None:
       """Load from your existing JSON format."""
@@ -42,7 +134,9 @@ class WebtoonDatabase:
         self._webtoons[url] = WebtoonData(
           title=info["title"],
           url=url,
-          monthly_data=info.get("data", {})
+          monthly_data=info.get("data", {}),
+          snapshots=info.get("snapshots", {}),
+          monthly_rollups=info.get("rollups", {})
         )
     
     def to_dict(self) -> Dict:
@@ -51,7 +145,9 @@ class WebtoonDatabase:
       for url, webtoon in self._webtoons.items():
         result[url] = {
           "title": webtoon.title,
-          "data": webtoon.monthly_data
+          "data": webtoon.monthly_data,
+          "snapshots": webtoon.snapshots,
+          "rollups": webtoon.monthly_rollups
         }
       return result
     
@@ -63,7 +159,16 @@ class WebtoonDatabase:
           url=webtoon_info.url,
           monthly_data={}
         )
-      self._webtoons[webtoon_info.url].add_current_month_data(webtoon_info.subscribers)
+      self.record_snapshot(webtoon_info.url, webtoon_info.subscribers)
+    
+    def record_snapshot(self, url: str, subscribers: int, now: Optional[datetime] = None) -> bool:
+      """Record a subscriber count at the configured granularity. Returns True if the webtoon exists."""
+      webtoon = self._webtoons.get(url)
+      if webtoon is None:
+        return False
+      webtoon.add_snapshot(subscribers, self.granularity, now)
+      webtoon.apply_retention(self.hourly_retention_days, self.daily_retention_days, now)
+      return True
     
     def remove_webtoon(self, url: str) -> bool:
       """Remove a webtoon. Returns True if found and removed."""
@@ -0,0 +1,145 @@
+"""Tests for snapshot rollups and retention in the data models."""
+
+import unittest
+from datetime import datetime
+from storage.models import WebtoonData, WebtoonDatabase, WebtoonInfo
+
+URL = "https://www.webtoons.com/en/example"
+
+def make_webtoon(monthly_data=None) -> WebtoonData:
+  return WebtoonData(title="Example", url=URL, monthly_data=monthly_data or {})
+
+class SnapshotRollupTests(unittest.TestCase):
+  """Incremental monthly rollup arithmetic."""
+  
+  def test_distinct_snapshots_are_rolled_up(self):
+    webtoon = make_webtoon()
+    for day, subscribers in [(1, 100), (2, 300), (3, 200)]:
+      webtoon.add_snapshot(subscribers, "daily", datetime(2026, 10, day))
+    
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 200, "min": 100, "max": 300, "mean": 200, "count": 3})
+    self.assertEqual(webtoon.monthly_data, {"2026-10": 200})
+  
+  def test_repeated_update_in_same_period_replaces_snapshot(self):
+    webtoon = make_webtoon()
+    now = datetime(2026, 10, 19, 12)
+    for subscribers in [100, 500, 500, 500]:
+      webtoon.add_snapshot(subscribers, "daily", now)
+    
+    self.assertEqual(webtoon.snapshots, {"2026-10-19": 500})
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 500, "min": 500, "max": 500, "mean": 500, "count": 1})
+  
+  def test_overwrite_recomputes_min_and_max(self):
+    webtoon = make_webtoon()
+    webtoon.add_snapshot(100, "daily", datetime(2026, 10, 1))
+    webtoon.add_snapshot(50, "daily", datetime(2026, 10, 2))
+    webtoon.add_snapshot(150, "daily", datetime(2026, 10, 2))
+    
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 150, "min": 100, "max": 150, "mean": 125, "count": 2})
+  
+  def test_monthly_granularity_keeps_one_value(self):
+    webtoon = make_webtoon()
+    for subscribers in [100, 200, 300]:
+      webtoon.add_snapshot(subscribers, "monthly", datetime(2026, 10, 19))
+    
+    self.assertEqual(webtoon.snapshots, {})
+    self.assertEqual(webtoon.monthly_rollups, {})
+    self.assertEqual(webtoon.monthly_data, {"2026-10": 300})
+    self.assertEqual(webtoon.get_monthly_rollup("2026-10"), {"last": 300, "min": 300, "max": 300, "mean": 300, "count": 1})
+  
+  def test_switching_to_monthly_and_back_resets_month(self):
+    webtoon = make_webtoon()
+    webtoon.add_snapshot(100, "daily", datetime(2026, 10, 1))
+    webtoon.add_snapshot(500, "daily", datetime(2026, 10, 2))
+    webtoon.add_snapshot(50, "daily", datetime(2026, 9, 30))
+    webtoon.add_snapshot(300, "monthly", datetime(2026, 10, 2))
+    
+    self.assertEqual(webtoon.snapshots, {"2026-09-30": 50})
+    self.assertNotIn("2026-10", webtoon.monthly_rollups)
+    
+    webtoon.add_snapshot(200, "daily", datetime(2026, 10, 2))
+    
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 200, "min": 200, "max": 300, "mean": 250, "count": 2})
+
+class LegacyDataTests(unittest.TestCase):
+  """Months recorded before rollups existed."""
+  
+  def test_legacy_month_has_single_value_rollup(self):
+    webtoon = make_webtoon({"2026-09": 50})
+    
+    self.assertEqual(webtoon.get_monthly_rollup("2026-09"), {"last": 50, "min": 50, "max": 50, "mean": 50, "count": 1})
+    self.assertIsNone(webtoon.get_monthly_rollup("2026-10"))
+  
+  def test_legacy_month_seeds_new_rollup(self):
+    webtoon = make_webtoon({"2026-10": 50})
+    webtoon.add_snapshot(100, "daily", datetime(2026, 10, 19))
+    
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 100, "min": 50, "max": 100, "mean": 75, "count": 2})
+  
+  def test_legacy_file_loads_and_saves(self):
+    database = WebtoonDatabase()
+    database.load_from_dict({URL: {"title": "Example", "data": {"2026-09": 50}}})
+    
+    self.assertEqual(database.to_dict(), {URL: {"title": "Example", "data": {"2026-09": 50}, "snapshots": {}, "rollups": {}}})
+
+class RetentionTests(unittest.TestCase):
+  """Downsampling and dropping of old snapshots."""
+  
+  def test_old_hourly_snapshots_downsample_to_last_of_day(self):
+    webtoon = make_webtoon()
+    webtoon.snapshots = {"2026-10-01": 90, "2026-10-01T08": 100, "2026-10-01T20": 120, "2026-10-18T08": 200}
+    webtoon.apply_retention(7, 90, datetime(2026, 10, 19))
+    
+    self.assertEqual(webtoon.snapshots, {"2026-10-01": 120, "2026-10-18T08": 200})
+  
+  def test_hourly_cutoff_day_is_kept(self):
+    webtoon = make_webtoon()
+    webtoon.snapshots = {"2026-10-11T23": 100, "2026-10-12T00": 110}
+    webtoon.apply_retention(7, 90, datetime(2026, 10, 19, 12))
+    
+    self.assertEqual(webtoon.snapshots, {"2026-10-11": 100, "2026-10-12T00": 110})
+  
+  def test_snapshots_past_retention_are_dropped_but_rollup_kept(self):
+    webtoon = make_webtoon()
+    webtoon.add_snapshot(100, "daily", datetime(2026, 7, 1))
+    webtoon.add_snapshot(200, "daily", datetime(2026, 10, 19))
+    webtoon.apply_retention(7, 90, datetime(2026, 10, 19))
+    
+    self.assertEqual(webtoon.snapshots, {"2026-10-19": 200})
+    self.assertEqual(webtoon.monthly_data, {"2026-07": 100, "2026-10": 200})
+    self.assertEqual(webtoon.monthly_rollups["2026-07"]["last"], 100)
+  
+  def test_overwrite_after_retention_keeps_bounds(self):
+    webtoon = make_webtoon()
+    webtoon.add_snapshot(50, "daily", datetime(2026, 10, 1))
+    webtoon.add_snapshot(100, "daily", datetime(2026, 10, 19))
+    webtoon.apply_retention(7, 5, datetime(2026, 10, 19))
+    webtoon.add_snapshot(120, "daily", datetime(2026, 10, 19))
+    
+    self.assertEqual(webtoon.monthly_rollups["2026-10"], {"last": 120, "min": 50, "max": 120, "mean": 85, "count": 2})
+
+class WebtoonDatabaseTests(unittest.TestCase):
+  """Snapshot settings on the database."""
+  
+  def test_record_snapshot_uses_configured_granularity(self):
+    database = WebtoonDatabase(granularity="hourly")
+    database.add_webtoon(WebtoonInfo(title="Example", subscribers=100, url=URL))
+    
+    self.assertTrue(database.record_snapshot(URL, 150, datetime(2026, 10, 19, 13)))
+    self.assertEqual(database.get_webtoon(URL).snapshots["2026-10-19T13"], 150)
+    self.assertFalse(database.record_snapshot("missing", 150))
+  
+  def test_unknown_granularity_is_rejected(self):
+    with self.assertRaises(ValueError):
+      WebtoonDatabase(granularity="weekly")
+  
+  def test_invalid_retention_is_rejected(self):
+    for days in ["7", None, -1, True, 1.5]:
+      with self.subTest(days=days):
+        with self.assertRaises(ValueError):
+          WebtoonDatabase(hourly_retention_days=days)
+        with self.assertRaises(ValueError):
+          WebtoonDatabase(daily_retention_days=days)
+
+if __name__ == "__main__":
+  unittest.main()
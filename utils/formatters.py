@@ -1,16 +1,30 @@
 """Text formatting utilities."""
 
 from datetime import datetime
+from typing import Optional
+
+# Snapshot key formats by granularity; every key starts with its YYYY-MM month
+SNAPSHOT_KEY_FORMATS = {
+  "monthly": "%Y-%m",
+  "daily": "%Y-%m-%d",
+  "hourly": "%Y-%m-%dT%H"
+}
 
 def normalize_title_for_sorting(title: str) -> str:
   """Normalize title for consistent sorting. Removes punctuation and converts to lowercase."""
   no_punc = title.translate(str.maketrans("", "", "'\u2019,"))
   return "".join(no_punc.split()).lower()
 
-def get_current_month_key() -> str:
-  """Get the current month in YYYY-MM format for data storage."""
-  return datetime.now().strftime("%Y-%m")
-
 def get_current_date_key() -> str:
   """Get the current date in YYYY-MM-DD format for reports."""
-  return datetime.now().strftime("%Y-%m-%d")
\ No newline at end of file
+  return datetime.now().strftime("%Y-%m-%d")
+
+def get_snapshot_key(granularity: str, now: Optional[datetime] = None) -> str:
+  """Get the snapshot key for the given granularity (monthly, daily or hourly)."""
+  if granularity not in SNAPSHOT_KEY_FORMATS:
+    raise ValueError(f"Unknown snapshot granularity: {granularity}")
+  return (now or datetime.now()).strftime(SNAPSHOT_KEY_FORMATS[granularity])
+
+def get_month_from_snapshot_key(snapshot_key: str) -> str:
+  """Get the YYYY-MM month a snapshot key belongs to."""
+  return snapshot_key[:7]